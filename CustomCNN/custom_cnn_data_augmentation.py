@@ -10,6 +10,7 @@ KERNEL_SIZE = (3, 3)
 ACTIVATION_FUNCTION = "sigmoid"
 AUGMENT = True
 CLASS_WEIGHTS = False
+DISTRIBUTED = False
 
 # Paths where the train images, test images and validation images are.
 TRAIN_PATH = "../../dataset/train"
@@ -31,7 +32,7 @@ def main():
 
     # Create the image classifier object
     model = CustomCNN(input_shape=TARGET_SIZE, num_classes=NUM_CLASSES, activation=ACTIVATION_FUNCTION,
-                      class_weights=CLASS_WEIGHTS, augment=AUGMENT)
+                      class_weights=CLASS_WEIGHTS, augment=AUGMENT, distributed=DISTRIBUTED)
 
     # Train the model
     history = model.train(train_generator, valid_generator, EPOCHS, step_size_train, step_size_valid)
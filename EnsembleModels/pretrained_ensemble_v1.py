@@ -5,9 +5,9 @@ from model import EnsembleModel
 TARGET_SIZE = (299, 299)
 BATCH_SIZE = 32
 MODEL_NAME = "Ensemble_v1"
-MODEL1_PATH = '../vgg16/models/vgg16/vgg16.h5'
-MODEL2_PATH = '../inceptionv3/models/inceptionv3/inceptionv3.h5'
-MODEL3_PATH = '../resnet50/models/resnet50/resnet50.h5'
+MODEL1_PATH = '../vgg16/models/vgg16/vgg16.keras'
+MODEL2_PATH = '../inceptionv3/models/inceptionv3/inceptionv3.keras'
+MODEL3_PATH = '../resnet50/models/resnet50/resnet50.keras'
 TEST_PATH = "../../dataset/test"
 
 
@@ -5,9 +5,9 @@ from model import EnsembleModel
 TARGET_SIZE = (299, 299)
 BATCH_SIZE = 32
 MODEL_NAME = "Ensemble_v2"
-MODEL1_PATH = '../vgg16/models/vgg16_data_augmentation/vgg16_data_augmentation.h5'
-MODEL2_PATH = '../inceptionv3/models/inceptionv3_data_augmentation/inceptionv3_data_augmentation.h5'
-MODEL3_PATH = '../resnet50/models/resnet50_data_augmentation/resnet50_data_augmentation.h5'
+MODEL1_PATH = '../vgg16/models/vgg16_data_augmentation/vgg16_data_augmentation.keras'
+MODEL2_PATH = '../inceptionv3/models/inceptionv3_data_augmentation/inceptionv3_data_augmentation.keras'
+MODEL3_PATH = '../resnet50/models/resnet50_data_augmentation/resnet50_data_augmentation.keras'
 TEST_PATH = "../../dataset/test"
 
 
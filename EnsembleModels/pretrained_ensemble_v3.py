@@ -5,9 +5,9 @@ from model import EnsembleModel
 TARGET_SIZE = (299, 299)
 BATCH_SIZE = 32
 MODEL_NAME = "Ensemble_v3"
-MODEL1_PATH = '../vgg16/models/vgg16_with_weights/vgg16_with_weights.h5'
-MODEL2_PATH = '../inceptionv3/models/inceptionv3_with_weights/inceptionv3_with_weights.h5.h5'
-MODEL3_PATH = '../resnet50/models/resnet50_with_weights/resnet50_with_weights.h5'
+MODEL1_PATH = '../vgg16/models/vgg16_with_weights/vgg16_with_weights.keras'
+MODEL2_PATH = '../inceptionv3/models/inceptionv3_with_weights/inceptionv3_with_weights.keras'
+MODEL3_PATH = '../resnet50/models/resnet50_with_weights/resnet50_with_weights.keras'
 TEST_PATH = "../../dataset/test"
 
 
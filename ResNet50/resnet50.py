@@ -10,6 +10,7 @@ MODEL = "ResNet50"
 ACTIVATION_FUNCTION = "sigmoid"
 AUGMENT = False
 CLASS_WEIGHTS = False
+DISTRIBUTED = False
 
 
 # Paths where the train images, test images and validation images are.
@@ -32,7 +33,7 @@ def main():
 
     # Create the image classifier object
     model = PreTrainedClassifier(TARGET_SIZE, num_classes=NUM_CLASSES, activation=ACTIVATION_FUNCTION, model_name=MODEL,
-                                 class_weight=CLASS_WEIGHTS, augment=AUGMENT)
+                                 class_weight=CLASS_WEIGHTS, augment=AUGMENT, distributed=DISTRIBUTED)
 
     # Train the model
     history = model.train(train_generator, valid_generator, EPOCHS, step_size_train, step_size_valid,)
@@ -19,24 +19,20 @@ class ImageDataHandler:
         self.batch_size = batch_size
         self.class_mode = class_mode
 
-    def create_datagen(self, rescale=1./255., augment=True):
+    def create_datagen(self, rescale=1./255.):
         """
         Creates an ImageDataGenerator object with specified parameters.
 
+        Augmentation is no longer done here: it runs as Keras preprocessing
+        layers inside the model, on the device, instead of in Python on the CPU.
+
         Args:
             rescale: The value to rescale pixel values (default: 1./255.).
-            augment: Whether to perform data augmentation (default: True).
 
         Returns:
             An ImageDataGenerator object.
         """
-        datagen = ImageDataGenerator(rescale=rescale)
-        if augment:
-            datagen = ImageDataGenerator(rescale=rescale,
-                                         shear_range=0.2,
-                                         zoom_range=0.2,
-                                         horizontal_flip=True)
-        return datagen
+        return ImageDataGenerator(rescale=rescale)
 
     def load_data(self, data_path, test=False, shuffle=True):
         """
@@ -51,7 +47,7 @@ class ImageDataHandler:
             A Keras ImageDataGenerator object.
         """
         if test:
-            datagen = self.create_datagen(augment=(shuffle is True))
+            datagen = self.create_datagen()
             return datagen.flow_from_directory(
                 directory=data_path,
                 target_size=self.target_size,
@@ -62,7 +58,7 @@ class ImageDataHandler:
                 seed=42
             )
         else:
-            datagen = self.create_datagen(augment=(shuffle is True))
+            datagen = self.create_datagen()
             return datagen.flow_from_directory(
                 directory=data_path,
                 target_size=self.target_size,
@@ -1,23 +1,71 @@
-from keras import Sequential
+from keras import Sequential, mixed_precision
 from keras.applications import VGG16, InceptionV3, ResNet50
-from keras.layers import Dense, GlobalAveragePooling2D, Activation, Flatten, MaxPooling2D, Conv2D, Input, Average
+from keras.layers import Dense, GlobalAveragePooling2D, Activation, Flatten, MaxPooling2D, Conv2D, Input, Average, \
+    RandomFlip, RandomRotation, RandomZoom, BatchNormalization
 from keras.models import Model, load_model
-from keras.callbacks import EarlyStopping
+from keras.callbacks import EarlyStopping, ModelCheckpoint
+from keras.optimizers import Adam
+import tensorflow as tf
 import numpy as np
 from sklearn.utils import compute_class_weight
-from sklearn.metrics import precision_recall_curve, recall_score, \
-    precision_score, accuracy_score, f1_score, confusion_matrix, roc_auc_score
+from sklearn.metrics import precision_recall_curve, confusion_matrix, roc_auc_score
 import matplotlib.pyplot as plt
-import seaborn as sns
+import functools
 import os
 
+# Let XLA auto-cluster and fuse elementwise ops around convolutions, on CPU too
+os.environ.setdefault("TF_XLA_FLAGS", "--tf_xla_auto_jit=2 --tf_xla_cpu_global_jit")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_backbone(model_name, input_shape, float16):
+    """
+    Builds a frozen pre-trained backbone, memoized on its hyperparameters.
+
+    Every classifier built with the same (model_name, input_shape, float16)
+    tuple - ensemble members, repeated runs in one process - reuses a single
+    deserialized, pre-traced Keras model instead of reloading the ~100 MB
+    ImageNet weights and rebuilding the graph each time.
+
+    Args:
+        model_name: One of "vgg16", "inceptionv3", or "resnet50".
+        input_shape: The spatial input shape, e.g. (120, 120).
+        float16: Whether to create the backbone variables directly in FP16.
+
+    Returns:
+        A frozen Keras Model with ImageNet weights and no top.
+    """
+    # The backbone stays frozen, so under mixed precision its variables can be
+    # created directly in FP16: the ImageNet weights are cast once at load
+    # instead of on every forward pass, halving weight memory and bandwidth
+    policy = mixed_precision.global_policy()
+    if float16:
+        mixed_precision.set_global_policy("float16")
+    try:
+        if model_name == "vgg16":
+            backbone = VGG16(weights="imagenet", include_top=False, input_shape=input_shape + (3,))
+        elif model_name == "inceptionv3":
+            backbone = InceptionV3(weights="imagenet", include_top=False, input_shape=input_shape + (3,))
+        elif model_name == "resnet50":
+            backbone = ResNet50(weights="imagenet", include_top=False, input_shape=input_shape + (3,))
+        else:
+            raise ValueError(f"Unsupported base model name: {model_name}")
+    finally:
+        mixed_precision.set_global_policy(policy)
+
+    # Freeze the backbone (optional for fine-tuning); setting the flag on the
+    # container is O(1) instead of walking every child layer in Python
+    backbone.trainable = False
+    return backbone
+
 
 class ImageClassifier:
     """
     This class defines a basic image classifier for training and evaluation.
     """
+
     def __init__(self, input_shape=(120, 120), num_classes=2, activation="sigmoid", class_weights=True, augment=True,
-                 model_name="VGG16"):
+                 model_name="VGG16", use_mixed_precision=True, distributed=False, steps_per_execution=32):
         """
         Initializer for the base ImageClassifier class.
 
@@ -25,6 +73,14 @@ class ImageClassifier:
             input_shape: The input shape for the model (e.g., (120, 120, 3)).
             num_classes: The number of output classes (default: 2).
             activation: The activation function for the final layer (default: sigmoid).
+            use_mixed_precision: Whether to train with the mixed_float16 policy (default: True).
+                Set to False for CPU-only runs or GPUs without Tensor Cores.
+            distributed: Whether to train across GPUs/nodes with Horovod
+                ring-allreduce (default: False). Requires horovod and a launch
+                via ``horovodrun -np N python <script>.py``.
+            steps_per_execution: How many training steps to run per tf.function
+                invocation (default: 32), amortizing the Python-to-C dispatch
+                across steps.
         """
         self.input_shape = input_shape
         self.num_classes = num_classes
@@ -32,15 +88,196 @@ class ImageClassifier:
         self.class_weights = class_weights
         self.augment = augment
         self.model_name = model_name.lower()
+        self.use_mixed_precision = use_mixed_precision
+        if use_mixed_precision:
+            # FP16 compute with FP32 variables; the final layer stays FP32 for a stable loss
+            mixed_precision.set_global_policy("mixed_float16")
+        else:
+            # The policy is process-global: reset it explicitly, or an earlier
+            # mixed-precision instance would leave this one building in FP16
+            # without a loss-scale optimizer
+            mixed_precision.set_global_policy("float32")
+        self.steps_per_execution = steps_per_execution
+        self.distributed = distributed
+        self._hvd = None
+        if distributed:
+            import horovod.tensorflow.keras as hvd
+            hvd.init()
+            # Pin each worker process to a single GPU
+            gpus = tf.config.list_physical_devices("GPU")
+            if gpus:
+                tf.config.set_visible_devices(gpus[hvd.local_rank()], "GPU")
+            self._hvd = hvd
         self.model = None  # Placeholder for the model
 
+    def _make_optimizer(self):
+        """
+        Creates the optimizer for compilation, wrapping Adam in a loss-scale
+        optimizer when mixed precision is enabled to avoid FP16 gradient underflow.
+        When distributed, Adam is wrapped in Horovod's DistributedOptimizer for
+        synchronous gradient averaging, with the learning rate scaled by world size.
+        """
+        if self.distributed:
+            optimizer = self._hvd.DistributedOptimizer(Adam(1e-3 * self._hvd.size()))
+        else:
+            optimizer = Adam()
+        if self.use_mixed_precision:
+            optimizer = mixed_precision.LossScaleOptimizer(optimizer)
+        return optimizer
+
     def _build_model(self):
         """
         Abstract method to be implemented by child classes to define the model architecture.
         """
         raise NotImplementedError("Subclasses must implement _build_model() method")
 
-    def train(self, train_data, validation_data, epochs, step_size_train, step_size_val):
+    def _fuse_bn(self):
+        """
+        Folds BatchNormalization layers into the preceding Conv2D for inference.
+
+        With frozen weights, a Conv followed by BN is algebraically a single
+        Conv: the BN scale/shift is absorbed into the Conv's kernel and bias
+        and the BN is reset to the identity. This saves a full pass over the
+        feature maps per BN on CPU; on GPU cuDNN already fuses these, so the
+        pass is skipped there. Runs at most once per model.
+        """
+        if getattr(self, "_bn_fused", False):
+            return
+        if tf.config.list_physical_devices("GPU"):
+            return
+        self._bn_fused = True
+
+        # Collect every layer, including those nested inside the base model
+        layers = []
+        stack = [self.model]
+        while stack:
+            container = stack.pop()
+            for layer in getattr(container, "layers", []):
+                layers.append(layer)
+                stack.append(layer)
+
+        conv_by_output = {id(layer.output): layer for layer in layers
+                          if isinstance(layer, Conv2D)}
+        for bn in layers:
+            if not isinstance(bn, BatchNormalization):
+                continue
+            conv = conv_by_output.get(id(bn.input))
+            if conv is None:
+                continue
+            if conv.bias is None and bn.beta is None:
+                # Nowhere to absorb the shift; leave this pair alone
+                continue
+
+            gamma = bn.gamma.numpy() if bn.gamma is not None else 1.0
+            beta = bn.beta.numpy() if bn.beta is not None else 0.0
+            mean = bn.moving_mean.numpy()
+            variance = bn.moving_variance.numpy()
+            scale = gamma / np.sqrt(variance + bn.epsilon)
+
+            if conv.bias is not None:
+                kernel, bias = conv.get_weights()
+                conv.set_weights([kernel * scale, (bias - mean) * scale + beta])
+                shift = np.zeros_like(mean)
+            else:
+                # Bias-less convs (every conv in InceptionV3) still absorb the
+                # scale into the kernel; the shift stays behind in the BN's
+                # beta, reducing the BN to a pure add
+                conv.set_weights([conv.get_weights()[0] * scale])
+                shift = beta - mean * scale
+
+            # Reset the BN to the residual shift (the identity when the conv
+            # took the bias) so the fold is not applied twice
+            residual = []
+            if bn.gamma is not None:
+                residual.append(np.ones_like(gamma))
+            if bn.beta is not None:
+                residual.append(shift)
+            residual.append(np.zeros_like(mean))
+            residual.append(np.ones_like(variance) - bn.epsilon)
+            bn.set_weights(residual)
+
+    def _model_dir(self, base_dir):
+        """
+        Resolves (and creates) the output directory for the current model variant.
+
+        Centralizes the class-weights/augmentation branching that was repeated
+        in every save/plot method, so each public method costs a single
+        makedirs stat call.
+
+        Args:
+            base_dir: The top-level output directory (e.g. "models" or "graphs").
+
+        Returns:
+            A (model_dir, variant) tuple, where variant is the directory's leaf name.
+        """
+        if self.class_weights:
+            variant = f"{self.model_name}_with_weights"
+        elif self.augment:
+            variant = f"{self.model_name}_data_augmentation"
+        else:
+            variant = self.model_name
+        model_dir = os.path.join(base_dir, variant)
+        os.makedirs(model_dir, exist_ok=True)  # Create directories if they don't exist
+        return model_dir, variant
+
+    def _augmentation_block(self):
+        """
+        Builds the data augmentation block used at the head of the model.
+
+        Running augmentation as layers keeps it inside the compiled graph on
+        the device (in FP16 under mixed precision), instead of serializing
+        with training on the CPU as ImageDataGenerator augmentation does.
+        The random transforms are only active while training.
+
+        Returns:
+            A Keras Sequential of random flip/rotation/zoom layers.
+        """
+        return Sequential([
+            RandomFlip("horizontal"),
+            RandomRotation(0.1),
+            RandomZoom(0.1),
+        ], name="augmentation")
+
+    def _wrap_generator(self, generator, cache_path=None):
+        """
+        Wraps a Keras ImageDataGenerator iterator in a tf.data.Dataset.
+
+        The generator is a single-threaded Python iterator, so consuming it
+        directly makes the GPU wait on CPU decode/preprocess each step.
+        Wrapping it in tf.data with prefetch(AUTOTUNE) overlaps host
+        preprocessing with device compute.
+
+        Args:
+            generator: A Keras ImageDataGenerator iterator yielding (images, labels) batches.
+            cache_path: Optional cache location for the decoded batches, so the
+                JPEG decode + resize cost is paid only on the first epoch. Pass
+                "" to cache in memory, or a file path to cache on disk
+                (default: None, no caching).
+
+        Returns:
+            A tf.data.Dataset yielding the same batches, with prefetching.
+        """
+        output_signature = (
+            tf.TensorSpec(shape=(None,) + self.input_shape + (3,), dtype=tf.float32),
+            tf.TensorSpec(shape=(None, self.num_classes), dtype=tf.float32),
+        )
+        dataset = tf.data.Dataset.from_generator(lambda: generator, output_signature=output_signature)
+        if cache_path is not None:
+            if cache_path:
+                cache_dir = os.path.dirname(cache_path)
+                if cache_dir:
+                    os.makedirs(cache_dir, exist_ok=True)
+            # The directory iterator loops forever, and tf.data only serves
+            # from a cache once a complete pass over the source has finished.
+            # Bound the dataset to one epoch so the cache can finalize, and
+            # reshuffle the cached batches on every repeat - the generator's
+            # own shuffling is frozen into the cache.
+            dataset = dataset.take(len(generator)).cache(cache_path) \
+                .shuffle(len(generator)).repeat()
+        return dataset.prefetch(tf.data.AUTOTUNE)
+
+    def train(self, train_data, validation_data, epochs, step_size_train, step_size_val, cache_path=None,
+              int8_export=False):
         """
         Trains the model on the provided data.
 
@@ -50,11 +287,44 @@ class ImageClassifier:
             epochs: The number of training epochs.
             step_size_train:.
             step_size_val:.
+            cache_path: Optional tf.data cache location for the training batches
+                ("" for in-memory); only use when the generator does not augment,
+                otherwise the first epoch's random transforms are replayed.
+            int8_export: Whether to also export a quantized int8 TFLite model
+                for CPU deployment after training (default: False).
 
         """
         early_stop = EarlyStopping(monitor="val_loss", patience=13, restore_best_weights=True)
+        callbacks = [early_stop]
+        if self.distributed:
+            # Sync initial weights across workers and average the reported metrics;
+            # each worker only needs to cover its share of the steps
+            callbacks = [self._hvd.callbacks.BroadcastGlobalVariablesCallback(0),
+                         self._hvd.callbacks.MetricAverageCallback()] + callbacks
+            step_size_train //= self._hvd.size()
+
+        # Keep each epoch a whole number of multi-step executions
+        if step_size_train >= self.steps_per_execution:
+            step_size_train = (step_size_train // self.steps_per_execution) * self.steps_per_execution
+
+        # Wrap the generators so input preprocessing overlaps with training steps
+        train_ds = self._wrap_generator(train_data, cache_path=cache_path)
+        val_ds = self._wrap_generator(validation_data)
+
+        # Save in the native .keras format: it streams tensors directly instead
+        # of going through the single-threaded HDF5 path
+        model_dir, variant = self._model_dir(f"models")
+        filepath = os.path.join(model_dir, f"{variant}.keras")
+
+        if self._hvd is None or self._hvd.rank() == 0:
+            # Checkpoint only the best weights during fit: streaming the raw
+            # tensors is far cheaper than re-serializing the full .keras
+            # archive on every val_loss improvement. The complete model is
+            # still written once after training.
+            weights_path = os.path.join(model_dir, f"{variant}.weights.h5")
+            callbacks.append(ModelCheckpoint(weights_path, monitor="val_loss", save_best_only=True,
+                                             save_weights_only=True))
 
-        base_dir = f"models"
         if self.class_weights:
             # Calculate class weights
             class_weight = compute_class_weight(
@@ -65,38 +335,60 @@ class ImageClassifier:
 
             weights = {0: class_weight[0], 1: class_weight[1]}
             history = self.model.fit(
-                train_data,
+                train_ds,
                 steps_per_epoch=step_size_train,
                 epochs=epochs,
-                validation_data=validation_data,
+                validation_data=val_ds,
                 validation_steps=step_size_val,
                 class_weight=weights,
-                callbacks=[early_stop],
+                callbacks=callbacks,
             )
-            model_dir = os.path.join(base_dir, f"{self.model_name}_with_weights")
-            filepath = os.path.join(model_dir, f"{self.model_name}_with_weights.h5")
-
         else:
             history = self.model.fit(
-                train_data,
+                train_ds,
                 steps_per_epoch=step_size_train,
                 epochs=epochs,
-                validation_data=validation_data,
+                validation_data=val_ds,
                 validation_steps=step_size_val,
-                callbacks=[early_stop],
+                callbacks=callbacks,
             )
-            if self.augment:
-                model_dir = os.path.join(base_dir, f"{self.model_name}_data_augmentation")
-                filepath = os.path.join(model_dir, f"{self.model_name}_data_augmentation.h5")
-            else:
-                model_dir = os.path.join(base_dir, f"{self.model_name}")
-                filepath = os.path.join(model_dir, f"{self.model_name}.h5")
 
-        os.makedirs(model_dir, exist_ok=True)  # Create directories if they don't exist
-        self.model.save(filepath)
+        if self._hvd is None or self._hvd.rank() == 0:
+            self.model.save(filepath)
+            if int8_export:
+                self.export_int8(train_ds)
 
         return history
 
+    def export_int8(self, rep_dataset, num_batches=100):
+        """
+        Exports a full-integer quantized TFLite version of the trained model.
+
+        Post-training quantization yields a model roughly 4x smaller that runs
+        2-3x faster on CPUs with int8 dot-product instructions, which suits the
+        CPU deployment path where FP16 gives no speedup.
+
+        Args:
+            rep_dataset: A tf.data.Dataset yielding (images, labels) batches,
+                used to calibrate the activation ranges.
+            num_batches: The number of batches to calibrate on (default: 100).
+
+        Returns:
+            The path of the written .tflite file.
+        """
+        converter = tf.lite.TFLiteConverter.from_keras_model(self.model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = lambda: ((images,) for images, _ in rep_dataset.take(num_batches))
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+
+        model_dir, variant = self._model_dir(f"models")
+        filepath = os.path.join(model_dir, f"{variant}_int8.tflite")
+        with open(filepath, "wb") as f:
+            f.write(converter.convert())
+        return filepath
+
     def evaluate(self, val_data, step_size):
         """
         Evaluates the model on the provided data.
@@ -108,35 +400,51 @@ class ImageClassifier:
         Returns:
             The evaluation metrics from the model.
         """
-        return self.model.evaluate(val_data,
+        self._fuse_bn()
+        return self.model.evaluate(self._wrap_generator(val_data),
                                    steps=step_size)
 
     def test(self, test_generator, step_size_test):
-        # Predicting the test data
-        prediction = self.model.predict(test_generator,
-                                        steps=step_size_test,
-                                        verbose=1)
-        return prediction
+        self._fuse_bn()
+
+        # XLA-compile the forward pass once and stream prefetched batches
+        # through it; this fuses the inference graph and avoids the legacy
+        # predict loop's per-step Python dispatch
+        @tf.function(jit_compile=True)
+        def _infer(images):
+            return self.model(images, training=False)
+
+        # Predicting the test data straight into a pre-allocated buffer,
+        # avoiding the per-batch list append and the final concatenate copy
+        # that doubles peak memory for large test sets
+        prediction = np.empty((test_generator.n, self.num_classes), dtype=np.float32)
+        offset = 0
+        for images, _ in self._wrap_generator(test_generator).take(step_size_test):
+            batch = _infer(images).numpy()
+            prediction[offset:offset + len(batch)] = batch
+            offset += len(batch)
+        return prediction[:offset]
 
     def plot_training_performance(self, history):
-        acc = history.history["accuracy"]
-        val_acc = history.history["val_accuracy"]
-        loss = history.history["loss"]
-        val_loss = history.history["val_loss"]
-        num_epochs = len(history.history['loss'])
+        hh = history.history
+        acc = hh["accuracy"]
+        val_acc = hh["val_accuracy"]
+        loss = hh["loss"]
+        val_loss = hh["val_loss"]
+        epochs_range = np.arange(len(loss))
 
         # Plotting how the validation and training accuracy was changing with the epochs when the model was training
         plt.figure(figsize=(15, 15))
         plt.subplot(2, 2, 1)
-        plt.plot(range(num_epochs), acc, label="Training Accuracy")
-        plt.plot(range(num_epochs), val_acc, label="Validation Accuracy")
+        plt.plot(epochs_range, acc, label="Training Accuracy")
+        plt.plot(epochs_range, val_acc, label="Validation Accuracy")
         plt.legend(loc="lower right")
         plt.title("Training and Validation Accuracy")
 
         # Plotting how the validation and training loss was changing with the epochs when the model was training
         plt.subplot(2, 2, 2)
-        plt.plot(range(num_epochs), loss, label="Training Loss")
-        plt.plot(range(num_epochs), val_loss, label="Validation Loss")
+        plt.plot(epochs_range, loss, label="Training Loss")
+        plt.plot(epochs_range, val_loss, label="Validation Loss")
         plt.legend(loc="upper right")
         plt.title("Training and Validation Loss")
 
@@ -148,34 +456,48 @@ class ImageClassifier:
                  horizontalalignment='center', verticalalignment='center',
                  transform=plt.gca().transAxes, fontsize=12)
 
-        base_dir = f"graphs"
-        if self.class_weights:
-            model_dir = os.path.join(base_dir, f"{self.model_name}_with_weights")
-        elif self.augment:
-            model_dir = os.path.join(base_dir, f"{self.model_name}_data_augmentation")
-        else:
-            model_dir = os.path.join(base_dir, f"{self.model_name}")
-
-        os.makedirs(model_dir, exist_ok=True)  # Create directories if they don't exist
+        model_dir, _ = self._model_dir(f"graphs")
         filepath = os.path.join(model_dir, "training_validation_graphs.png")
 
         plt.savefig(filepath)
         plt.show()
 
     def evaluation_metrics(self, prediction, test_generator):
-        # Creating an array with all the predictions
-        pred = np.argmax(prediction, axis=1)
-        true_labels = test_generator.classes
-
-        accuracy = accuracy_score(true_labels, pred)
-        f1 = f1_score(true_labels, pred, average='macro')
-        roc_auc = roc_auc_score(true_labels, pred)
-
-        prec, recall, _ = precision_recall_curve(true_labels, pred)
+        # The metric derivation below (and the PR/ROC handling) is written for
+        # the binary case; fail loudly rather than mis-report on multiclass
+        if self.num_classes != 2:
+            raise ValueError("evaluation_metrics only supports binary classification")
+
+        # Creating an array with all the predictions: a thresholded compare on
+        # the positive-class column is a single SIMD pass and yields a
+        # one-byte-per-sample buffer, instead of argmax's two-column reduction
+        pred = (prediction[:, 1] >= 0.5).astype(np.int8)
+        true_labels = np.asarray(test_generator.classes, dtype=np.int8)
+
+        # A single confusion-matrix pass over the labels; the scalar metrics
+        # are then derived from the 2x2 counts instead of re-scanning the
+        # arrays once per sklearn call. Empty denominators yield 0, matching
+        # sklearn's zero_division behaviour
+        conf_mat = confusion_matrix(true_labels, pred)
+        tn, fp, fn, tp = conf_mat.ravel()
+        accuracy = (tp + tn) / conf_mat.sum()
+        precision = tp / (tp + fp) if tp + fp else 0.0
+        recall = tp / (tp + fn) if tp + fn else 0.0
+        f1_pos = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+        neg_precision = tn / (tn + fn) if tn + fn else 0.0
+        neg_recall = tn / (tn + fp) if tn + fp else 0.0
+        f1_neg = (2 * neg_precision * neg_recall / (neg_precision + neg_recall)
+                  if neg_precision + neg_recall else 0.0)
+        f1 = (f1_pos + f1_neg) / 2
+
+        # ROC AUC and the PR curve need scores, not hard labels: use the
+        # positive-class probability
+        roc_auc = roc_auc_score(true_labels, prediction[:, 1])
+        prec_curve, rec_curve, _ = precision_recall_curve(true_labels, prediction[:, 1])
         # Plotting the graph of Precision vs Recall
         plt.figure(figsize=(15, 15))
         plt.subplot(2, 2, 1)
-        plt.plot(prec, recall)
+        plt.plot(prec_curve, rec_curve)
         plt.title("Precision vs Recall")
 
         # Add the F1 score as text annotation to the plots
@@ -184,30 +506,25 @@ class ImageClassifier:
                  horizontalalignment='center', verticalalignment='center',
                  transform=plt.gca().transAxes, fontsize=12)
 
-        base_dir = f"graphs"
-        if self.class_weights:
-            model_dir = os.path.join(base_dir, f"{self.model_name}_with_weights")
-        elif self.augment:
-            model_dir = os.path.join(base_dir, f"{self.model_name}_data_augmentation")
-        else:
-            model_dir = os.path.join(base_dir, f"{self.model_name}")
-
-        os.makedirs(model_dir, exist_ok=True)  # Create directories if they don't exist
+        model_dir, _ = self._model_dir(f"graphs")
 
         filepath = os.path.join(model_dir, "precision_recall_graph.png")
         plt.savefig(filepath)
         plt.show()
-        # Calculate and plot the confusion matrix for the best model
-        conf_mat = confusion_matrix(true_labels, pred)
+        # Plot the confusion matrix for the best model
         class_labels = test_generator.class_indices
         class_names = list(class_labels.keys())
 
-        plt.figure(figsize=(8, 8))
-        sns.heatmap(conf_mat, annot=True, fmt='d', cmap='Blues', cbar=False,
-                    xticklabels=class_names, yticklabels=class_names)
-        plt.title('Confusion Matrix')
-        plt.xlabel('Predicted')
-        plt.ylabel('Actual')
+        fig, ax = plt.subplots(figsize=(8, 8))
+        ax.imshow(conf_mat, cmap='Blues')
+        ax.set_xticks(range(len(class_names)), class_names)
+        ax.set_yticks(range(len(class_names)), class_names)
+        for i in range(conf_mat.shape[0]):
+            for j in range(conf_mat.shape[1]):
+                ax.text(j, i, conf_mat[i, j], ha='center', va='center')
+        ax.set_title('Confusion Matrix')
+        ax.set_xlabel('Predicted')
+        ax.set_ylabel('Actual')
 
         filepath = os.path.join(model_dir, "confusion_matrix.png")
         plt.savefig(filepath)
@@ -215,14 +532,15 @@ class ImageClassifier:
         plt.show()
 
         print("\nAccuracy:", accuracy)
-        print("Precision:", precision_score(true_labels, pred))
-        print("Recall:", recall_score(true_labels, pred))
+        print("Precision:", precision)
+        print("Recall:", recall)
         print("F1 Score:", f1)
         print("ROC AUC Score: ", roc_auc)
 
 
 class PreTrainedClassifier(ImageClassifier):
-    def __init__(self, input_shape, num_classes, activation, class_weight, augment, model_name):
+    def __init__(self, input_shape, num_classes, activation, class_weight, augment, model_name,
+                 use_mixed_precision=True, distributed=False, steps_per_execution=32):
         """
         Initializer for the ImageClassifier class.
 
@@ -231,7 +549,9 @@ class PreTrainedClassifier(ImageClassifier):
             num_classes: The number of output classes (default: 2).
             activation: The activation function for the final layer (default: sigmoid).
         """
-        super().__init__(input_shape, num_classes, activation, class_weight, augment, model_name)
+        super().__init__(input_shape, num_classes, activation, class_weight, augment, model_name,
+                         use_mixed_precision, distributed=distributed,
+                         steps_per_execution=steps_per_execution)
         self.model = self._build_model()
 
     def _build_model(self):
@@ -241,37 +561,38 @@ class PreTrainedClassifier(ImageClassifier):
         Returns:
             A compiled Keras model.
         """
-        # Load the pre-trained base model based on the argument
-        if self.model_name == "vgg16":
-            base_model = VGG16(weights="imagenet", include_top=False, input_shape=self.input_shape + (3,))
-        elif self.model_name == "inceptionv3":
-            base_model = InceptionV3(weights="imagenet", include_top=False, input_shape=self.input_shape + (3,))
-        elif self.model_name == "resnet50":
-            base_model = ResNet50(weights="imagenet", include_top=False, input_shape=self.input_shape + (3,))
-        else:
-            raise ValueError(f"Unsupported base model name: {self.model_name}")
-
-        # Freeze the base model layers (optional for fine-tuning)
-        for layer in base_model.layers:
-            layer.trainable = False
-
-        # Add custom layers for classification
-        x = base_model.output
-        x = GlobalAveragePooling2D()(x)
-        x = Dense(self.num_classes, activation=self.activation)(x)
+        # Load the pre-trained base model based on the argument; the memoized
+        # loader returns the shared frozen instance on repeat builds
+        base_model = _load_backbone(self.model_name, self.input_shape, self.use_mixed_precision)
+
+        # Add custom layers for classification, with on-device augmentation at the head
+        inputs = Input(shape=self.input_shape + (3,))
+        x = self._augmentation_block()(inputs) if self.augment else inputs
+        x = base_model(x)
+        # A 1x1 conv ahead of the pooling is mathematically the same as
+        # GAP followed by Dense (the average commutes with a linear map) but
+        # dispatches as one fused conv kernel. The classifier and activation
+        # stay in FP32 so sigmoid/softmax + crossentropy remain numerically stable
+        x = Conv2D(self.num_classes, 1, dtype="float32")(x)
+        x = GlobalAveragePooling2D(dtype="float32")(x)
+        x = Activation(self.activation, dtype="float32")(x)
 
         # Create the final model
-        model = Model(inputs=base_model.input, outputs=x)
+        model = Model(inputs=inputs, outputs=x)
 
-        # Compile the model with optimizer, loss function, and metrics (replace with your choice)
-        model.compile(optimizer="adam", loss="binary_crossentropy", metrics=["accuracy"])
+        # Compile the model with optimizer, loss function, and metrics (replace with your choice).
+        # XLA fuses the Conv/BN/activation chains; InceptionV3's multi-branch
+        # shapes can trigger repeated recompiles, so it is left to the env flag there
+        model.compile(optimizer=self._make_optimizer(), loss="binary_crossentropy", metrics=["accuracy"],
+                      jit_compile=self.model_name != "inceptionv3",
+                      steps_per_execution=self.steps_per_execution)
 
         return model
 
 
 class CustomCNN(ImageClassifier):
     def __init__(self, input_shape, num_classes=2, activation="sigmoid", class_weights=True, augment=True,
-                 kernel_size=(3, 3)):
+                 kernel_size=(3, 3), use_mixed_precision=True, distributed=False, steps_per_execution=32):
         """
         Initializer for the ImageClassifier class.
 
@@ -281,7 +602,9 @@ class CustomCNN(ImageClassifier):
             activation: The activation function for the final layer (default: sigmoid).
         """
         self.model_name = "custom_cnn"
-        super().__init__(input_shape, num_classes, activation, class_weights, augment, self.model_name)
+        super().__init__(input_shape, num_classes, activation, class_weights, augment, self.model_name,
+                         use_mixed_precision, distributed=distributed,
+                         steps_per_execution=steps_per_execution)
         self.kernel_size = kernel_size
         self.model = self._build_model()
 
@@ -289,7 +612,10 @@ class CustomCNN(ImageClassifier):
 
         # Creating a Sequential mode
         model = Sequential()
-        model.add(Conv2D(32, self.kernel_size, padding="same", input_shape=self.input_shape + (3,)))
+        model.add(Input(shape=self.input_shape + (3,)))
+        if self.augment:
+            model.add(self._augmentation_block())
+        model.add(Conv2D(32, self.kernel_size, padding="same"))
         model.add(Activation("relu"))
         model.add(MaxPooling2D(pool_size=(2, 2)))
 
@@ -302,20 +628,26 @@ class CustomCNN(ImageClassifier):
         model.add(MaxPooling2D(pool_size=(2, 2)))
 
         model.add(Flatten())
-        model.add(Dense(self.num_classes, activation=self.activation))
-        model.compile(optimizer='adam', loss='binary_crossentropy', metrics=['accuracy'])
+        model.add(Dense(self.num_classes, activation=self.activation, dtype="float32"))
+        model.compile(optimizer=self._make_optimizer(), loss='binary_crossentropy', metrics=['accuracy'],
+                      jit_compile=True, steps_per_execution=self.steps_per_execution)
 
         return model
 
 
 class EnsembleModel(ImageClassifier):
-    def __init__(self, input_shape, model1_path, model2_path, model3_path, model_name):
+    def __init__(self, input_shape, model1_path, model2_path, model3_path, model_name,
+                 use_mixed_precision=False):
         """
         Initializer for the ImageClassifier class.
 
         Args:
+            use_mixed_precision: Whether to run the ensemble under the
+                mixed_float16 policy (default: False, so averaging the member
+                predictions keeps full FP32 precision).
         """
-        super().__init__(input_shape=input_shape, model_name=model_name)
+        super().__init__(input_shape=input_shape, model_name=model_name,
+                         use_mixed_precision=use_mixed_precision)
         self.model1_path = model1_path
         self.model2_path = model2_path
         self.model3_path = model3_path
@@ -354,19 +686,41 @@ class EnsembleModel(ImageClassifier):
         return model
 
     def evaluation_metrics(self, prediction, test_generator):
-        # Creating an array with all the predictions
-        pred = np.argmax(prediction, axis=1)
-        true_labels = test_generator.classes
-
-        accuracy = accuracy_score(true_labels, pred)
-        f1 = f1_score(true_labels, pred, average='macro')
-        roc_auc = roc_auc_score(true_labels, pred)
-
-        prec, recall, _ = precision_recall_curve(true_labels, pred)
+        # The metric derivation below (and the PR/ROC handling) is written for
+        # the binary case; fail loudly rather than mis-report on multiclass
+        if self.num_classes != 2:
+            raise ValueError("evaluation_metrics only supports binary classification")
+
+        # Creating an array with all the predictions: a thresholded compare on
+        # the positive-class column is a single SIMD pass and yields a
+        # one-byte-per-sample buffer, instead of argmax's two-column reduction
+        pred = (prediction[:, 1] >= 0.5).astype(np.int8)
+        true_labels = np.asarray(test_generator.classes, dtype=np.int8)
+
+        # A single confusion-matrix pass over the labels; the scalar metrics
+        # are then derived from the 2x2 counts instead of re-scanning the
+        # arrays once per sklearn call. Empty denominators yield 0, matching
+        # sklearn's zero_division behaviour
+        conf_mat = confusion_matrix(true_labels, pred)
+        tn, fp, fn, tp = conf_mat.ravel()
+        accuracy = (tp + tn) / conf_mat.sum()
+        precision = tp / (tp + fp) if tp + fp else 0.0
+        recall = tp / (tp + fn) if tp + fn else 0.0
+        f1_pos = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+        neg_precision = tn / (tn + fn) if tn + fn else 0.0
+        neg_recall = tn / (tn + fp) if tn + fp else 0.0
+        f1_neg = (2 * neg_precision * neg_recall / (neg_precision + neg_recall)
+                  if neg_precision + neg_recall else 0.0)
+        f1 = (f1_pos + f1_neg) / 2
+
+        # ROC AUC and the PR curve need scores, not hard labels: use the
+        # positive-class probability
+        roc_auc = roc_auc_score(true_labels, prediction[:, 1])
+        prec_curve, rec_curve, _ = precision_recall_curve(true_labels, prediction[:, 1])
         # Plotting the graph of Precision vs Recall
         plt.figure(figsize=(15, 15))
         plt.subplot(2, 2, 1)
-        plt.plot(prec, recall)
+        plt.plot(prec_curve, rec_curve)
         plt.title("Precision vs Recall")
 
         # Add the F1 score as text annotation to the plots
@@ -383,17 +737,20 @@ class EnsembleModel(ImageClassifier):
         filepath = os.path.join(model_dir, "precision_recall_graph.png")
         plt.savefig(filepath)
         plt.show()
-        # Calculate and plot the confusion matrix for the best model
-        conf_mat = confusion_matrix(true_labels, pred)
+        # Plot the confusion matrix for the best model
         class_labels = test_generator.class_indices
         class_names = list(class_labels.keys())
 
-        plt.figure(figsize=(8, 8))
-        sns.heatmap(conf_mat, annot=True, fmt='d', cmap='Blues', cbar=False,
-                    xticklabels=class_names, yticklabels=class_names)
-        plt.title('Confusion Matrix')
-        plt.xlabel('Predicted')
-        plt.ylabel('Actual')
+        fig, ax = plt.subplots(figsize=(8, 8))
+        ax.imshow(conf_mat, cmap='Blues')
+        ax.set_xticks(range(len(class_names)), class_names)
+        ax.set_yticks(range(len(class_names)), class_names)
+        for i in range(conf_mat.shape[0]):
+            for j in range(conf_mat.shape[1]):
+                ax.text(j, i, conf_mat[i, j], ha='center', va='center')
+        ax.set_title('Confusion Matrix')
+        ax.set_xlabel('Predicted')
+        ax.set_ylabel('Actual')
 
         filepath = os.path.join(model_dir, "confusion_matrix.png")
         plt.savefig(filepath)
@@ -401,7 +758,7 @@ class EnsembleModel(ImageClassifier):
         plt.show()
 
         print("\nAccuracy:", accuracy)
-        print("Precision:", precision_score(true_labels, pred))
-        print("Recall:", recall_score(true_labels, pred))
+        print("Precision:", precision)
+        print("Recall:", recall)
         print("F1 Score:", f1)
         print("ROC AUC Score: ", roc_auc)